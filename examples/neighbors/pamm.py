@@ -34,6 +34,34 @@ from skmatter.neighbors._sparsekde import _covariance
 from skmatter.utils import oas
 
 
+# %%
+def _cluster_logsumexp(probs: np.ndarray, labels: np.ndarray):
+    """
+    Log of the summed probabilities of each cluster, computed in a single pass by
+    sorting the points by their label.
+
+    Parameters
+    ----------
+    probs : np.ndarray
+        Log-probability density of the input data
+    labels : np.ndarray
+        Labels of the input data, each one being the index of a cluster center
+
+    Returns
+    -------
+    center_idx : np.ndarray
+        Sorted indices of the cluster centers, i.e. the distinct labels
+    logpks : np.ndarray
+        Log of the summed probabilities of the cluster of each center
+    """
+    order = np.argsort(labels, kind="stable")
+    # the groups are taken from the sorted labels themselves, so that the boundaries
+    # are always increasing and cover all the points
+    center_idx, boundaries = np.unique(labels[order], return_index=True)
+
+    return center_idx, np.logaddexp.reduceat(probs[order], boundaries)
+
+
 # %%
 def quick_shift_refinement(
     X: np.ndarray,
@@ -60,7 +88,7 @@ def quick_shift_refinement(
     metric_params : dict, default=None
         Additional parameters to be passed to the use of
         metric.  i.e. the cell dimension for `periodic_euclidean`
-        {'cell': [2, 2]}
+        {'cell_length': [2, 2]}
     thrpcl : float, default=0.0
     Clusters with a pk lower than this value are merged with the nearest cluster.
     """
@@ -70,39 +98,33 @@ def quick_shift_refinement(
             raise ValueError("Cell dimension does not match the data dimension.")
     else:
         cell = None
+        metric_params = {}
 
     normpks = logsumexp(probs)
-    nk = len(cluster_centers_idx)
-    to_merge = np.full(nk, False)
-
-    for k in range(nk):
-        dummd1 = np.exp(logsumexp(probs[labels == cluster_centers_idx[k]]) - normpks)
-        to_merge[k] = dummd1 > thrpcl
-    # merge the outliers
-    for i in range(nk):
-        if not to_merge[k]:
-            continue
-        dummd1yi1 = cluster_centers_idx[i]
-        dummd1 = np.inf
-        for j in range(nk):
-            if to_merge[k]:
-                continue
-            dummd2 = metric(X[labels[dummd1yi1]], X[labels[j]], cell=cell)
-            if dummd2 < dummd1:
-                dummd1 = dummd2
-                cluster_centers_idx[i] = j
-        labels[labels == dummd1yi1] = cluster_centers_idx[i]
-    if sum(to_merge) > 0:
-        cluster_centers_idx = np.concatenate(
-            np.argwhere(labels == np.arange(len(labels)))
-        )
-        nk = len(cluster_centers_idx)
-        for i in range(nk):
-            dummd1yi1 = cluster_centers_idx[i]
-            cluster_centers_idx[i] = np.argmax(
-                np.ma.array(probs, mask=labels != cluster_centers_idx[i])
-            )
-            labels[labels == dummd1yi1] = cluster_centers_idx[i]
+    # the cluster centers are taken from the labels, sorted and in the same order as
+    # their pks
+    cluster_centers_idx, logpks = _cluster_logsumexp(probs, labels)
+    pks = np.exp(logpks - normpks)
+    to_merge = pks < thrpcl
+    # merge the outliers into the nearest cluster which is not an outlier
+    if np.any(to_merge) and not np.all(to_merge):
+        outliers = cluster_centers_idx[to_merge]
+        retained = cluster_centers_idx[~to_merge]
+        center_dist = metric(X[outliers], X[retained], **metric_params)
+        # relabel all the points with a single lookup of their new root
+        new_root = np.arange(len(labels))
+        new_root[outliers] = retained[np.argmin(center_dist, axis=1)]
+        labels[:] = new_root[labels]
+    if np.any(to_merge):
+        # move the centers to the most probable point of each cluster: sorting by
+        # label and decreasing probability puts it first in each group
+        old_centers = np.unique(labels)
+        order = np.lexsort((-probs, labels))
+        cluster_centers_idx = order[np.searchsorted(labels[order], old_centers)]
+        new_root = np.arange(len(labels))
+        new_root[old_centers] = cluster_centers_idx
+        labels[:] = new_root[labels]
+        cluster_centers_idx = np.sort(cluster_centers_idx)
 
     return cluster_centers_idx, labels
 
@@ -149,15 +171,13 @@ def generate_probability_model(
         probs: np.ndarray,
         idxroot: np.ndarray,
         center_idx: np.ndarray,
+        logpk: float,
     ):
 
         if cell is not None:
-            cov = _get_lcov_clusterp(
-                len(X), nsamples, X, idxroot, center_idx[k], probs, cell
-            )
+            cov = _get_lcov_clusterp(nsamples, X, idxroot, center_idx[k], probs, cell)
             if np.sum(idxroot == center_idx[k]) == 1:
                 cov = _get_lcov_clusterp(
-                    nsamples,
                     nsamples,
                     descriptors,
                     sample_labels,
@@ -167,10 +187,9 @@ def generate_probability_model(
                 )
                 print("Warning: single point cluster!")
         else:
-            cov = _get_lcov_cluster(len(X), X, idxroot, center_idx[k], probs, cell)
+            cov = _get_lcov_cluster(X, idxroot, center_idx[k], probs, cell)
             if np.sum(idxroot == center_idx[k]) == 1:
                 cov = _get_lcov_cluster(
-                    nsamples,
                     descriptors,
                     sample_labels,
                     center_idx[k],
@@ -178,16 +197,11 @@ def generate_probability_model(
                     cell,
                 )
                 print("Warning: single point cluster!")
-            cov = oas(
-                cov,
-                logsumexp(probs[idxroot == center_idx[k]]) * nsamples,
-                X.shape[1],
-            )
+            cov = oas(cov, logpk * nsamples, X.shape[1])
 
         return cov
 
     def _get_lcov_cluster(
-        N: int,
         x: np.ndarray,
         clroots: np.ndarray,
         idcl: int,
@@ -195,15 +209,15 @@ def generate_probability_model(
         cell: np.ndarray,
     ):
 
-        ww = np.zeros(N)
-        normww = logsumexp(probs[clroots == idcl])
-        ww[clroots == idcl] = np.exp(probs[clroots == idcl] - normww)
-        cov = _covariance(x, ww, cell)
+        # the points outside of the cluster have a zero weight and do not contribute
+        # to the covariance, so only the points of the cluster are passed on
+        members = clroots == idcl
+        ww = np.exp(probs[members] - logsumexp(probs[members]))
+        cov = _covariance(x[members], ww, cell)
 
         return cov
 
     def _get_lcov_clusterp(
-        N: int,
         Ntot: int,
         x: np.ndarray,
         clroots: np.ndarray,
@@ -212,20 +226,17 @@ def generate_probability_model(
         cell: np.ndarray,
     ):
 
-        ww = np.zeros(N)
+        # only the points of the cluster have a non-zero weight, so the periodic wrap
+        # and the circular moments are restricted to them
+        members = clroots == idcl
         totnormp = logsumexp(probs)
-        cov = np.zeros((x.shape[1], x.shape[1]), dtype=float)
-        xx = np.zeros(x.shape, dtype=float)
-        ww[clroots == idcl] = np.exp(probs[clroots == idcl] - totnormp)
-        ww *= Ntot
+        ww = np.exp(probs[members] - totnormp) * Ntot
         nlk = np.sum(ww)
-        for i in range(x.shape[1]):
-            xx[:, i] = x[:, i] - np.round(x[:, i] / cell[i]) * cell[i]
-            r2 = (np.sum(ww * np.cos(xx[:, i])) / nlk) ** 2 + (
-                np.sum(ww * np.sin(xx[:, i])) / nlk
-            ) ** 2
-            re2 = (nlk / (nlk - 1)) * (r2 - (1 / nlk))
-            cov[i, i] = 1 / (np.sqrt(re2) * (2 - re2) / (1 - re2))
+        xx = x[members]
+        xx -= np.round(xx / cell) * cell
+        r2 = (ww @ np.cos(xx) / nlk) ** 2 + (ww @ np.sin(xx) / nlk) ** 2
+        re2 = (nlk / (nlk - 1)) * (r2 - (1 / nlk))
+        cov = np.diag(1 / (np.sqrt(re2) * (2 - re2) / (1 - re2)))
 
         return cov
 
@@ -236,17 +247,16 @@ def generate_probability_model(
     dimension = X.shape[1]
     cluster_mean = np.zeros((nclusters, dimension), dtype=float)
     cluster_cov = np.zeros((nclusters, dimension, dimension), dtype=float)
-    cluster_weight = np.zeros(nclusters, dtype=float)
-    center_idx = np.unique(labels)
     normpks = logsumexp(probs)
+    center_idx, cluster_logpk = _cluster_logsumexp(probs, labels)
+    cluster_weight = np.exp(cluster_logpk - normpks)
 
     for k in range(nclusters):
-        cluster_weight[k] = np.exp(logsumexp(probs[labels == center_idx[k]]) - normpks)
         cluster_cov[k] = _update_cluster_cov(
-            X, k, descriptor_labels, probs, labels, center_idx
+            X, k, descriptor_labels, probs, labels, center_idx, cluster_logpk[k]
         )
-    for k in range(nclusters):
-        labels[labels == center_idx[k]] = k + 1
+    # center_idx is sorted, so the position of each label in it is the cluster index
+    labels[:] = np.searchsorted(center_idx, labels) + 1
 
     return cluster_weight, cluster_mean, cluster_cov, labels
 
@@ -348,7 +358,7 @@ cluster_distribution_3D(
 
 # %%
 probs = estimator.score_samples(grids)
-qscuts = np.array([np.trace(cov) for cov in estimator._covariance])
+qscuts = np.trace(estimator._covariance, axis1=1, axis2=2)
 clustering = QuickShift(
     qscuts**2,
     metric_params=estimator.metric_params,
@@ -358,13 +368,12 @@ cluster_centers_idx = clustering.cluster_centers_idx_
 labels = clustering.labels_
 normpks = logsumexp(probs)
 
-cluster_centers, labels = quick_shift_refinement(
+cluster_centers_idx, labels = quick_shift_refinement(
     grids,
     cluster_centers_idx,
     labels,
     probs,
     estimator.metric,
-    estimator.cell,
 )
 
 # %%
@@ -27,9 +27,10 @@ import time
 import matplotlib.pyplot as plt
 import numpy as np
 from scipy.stats import gaussian_kde
+from sklearn.utils import gen_batches
 
-from skmatter.feature_selection import FPS
 from skmatter.neighbors import SparseKDE
+from skmatter.sample_selection import BucketFPS
 
 
 # %%
@@ -61,14 +62,18 @@ plt.show()
 
 # %%
 # Sparse KDE requires a discretization of the sample space. Here, we use
-# the FPS method to generate grid points in the sample space:
+# the FPS method to generate grid points in the sample space. Since there are many
+# samples in a low dimensional space, we use the ``BucketFPS`` variant, which gives
+# the same selection of FPS while only updating the distances of the samples close to
+# each new grid point:
 #
 #
 
 # %%
 start1 = time.time()
-selector = FPS(n_to_select=int(np.sqrt(3 * N_SAMPLES)))
-grids = selector.fit_transform(samples.T).T
+selector = BucketFPS(n_to_select=int(np.sqrt(3 * N_SAMPLES)))
+selector.fit(samples)
+grids = samples[selector.selected_idx_]
 end1 = time.time()
 fig, ax = plt.subplots()
 ax.scatter(samples[:, 0], samples[:, 1], alpha=0.05, s=1)
@@ -111,31 +116,46 @@ class GaussianMixtureModel:
         self.covariances = covariances
         self.period = period
         self.dimension = self.means.shape[1]
-        self.cov_inv = np.linalg.inv(self.covariances)
-        self.cov_det = np.linalg.det(self.covariances)
-        self.norm = 1 / np.sqrt((2 * np.pi) ** self.dimension * self.cov_det)
-
-    def __call__(self, x: np.ndarray, i: int = None):
-
-        if len(x.shape) == 1:
-            x = x[np.newaxis, :]
+        # Cholesky factors of the precisions, such that the inverse of each covariance
+        # is prec_chol @ prec_chol.T, as in sklearn.mixture.GaussianMixture
+        cov_chol = np.linalg.cholesky(self.covariances)
+        self.prec_chol = np.linalg.inv(cov_chol).transpose(0, 2, 1)
+        log_det = 2 * np.sum(np.log(np.diagonal(cov_chol, axis1=1, axis2=2)), axis=1)
+        self.norm = np.exp(-0.5 * (self.dimension * np.log(2 * np.pi) + log_det))
+
+    def __call__(self, x: np.ndarray, i: int = None, batch_size: int = 32):
+        # evaluate the points in batches, x has shape (n_points, dimension), so that
+        # the (batch_size, n_components, dimension) temporaries stay in cache
+        x = np.atleast_2d(x)
+        probs = np.empty(len(x))
+        for batch in gen_batches(len(x), batch_size):
+            probs[batch] = self._evaluate(x[batch], i)
+
+        return probs
+
+    def _evaluate(self, x: np.ndarray, i: int = None):
         if self.period is not None:
-            xij = np.zeros(self.means.shape)
-            xij = rij(self.period, xij, x)
+            xij = rij(self.period, x[:, np.newaxis, :], self.means[np.newaxis, :, :])
+            # xij @ prec_chol for all the components, accumulated over the (few)
+            # dimensions, which is faster than many small matrix products
+            y = xij[:, :, :1] * self.prec_chol[:, 0, :]
+            for d in range(1, self.dimension):
+                y += xij[:, :, d : d + 1] * self.prec_chol[:, d, :]
         else:
-            xij = x - self.means
-        p = (
-            self.weights
-            * self.norm
-            * np.exp(
-                -0.5 * (xij[:, np.newaxis, :] @ self.cov_inv @ xij[:, :, np.newaxis])
-            ).reshape(-1)
-        )
-        sum_p = np.sum(p)
+            # (x - mean) @ prec_chol for all the components with a single product
+            y = x @ self.prec_chol.transpose(1, 0, 2).reshape(self.dimension, -1)
+            y = y.reshape(len(x), -1, self.dimension)
+            y -= np.einsum("kd,kde->ke", self.means, self.prec_chol)
+        # exponentiate the quadratic form in place and contract it directly with the
+        # weights, rather than forming the weighted probabilities and summing them
+        p = np.einsum("nkd,nkd->nk", y, y)
+        p *= -0.5
+        np.exp(p, out=p)
         if i is None:
-            return sum_p
+            return p @ (self.weights * self.norm)
 
-        return np.sum(p[i]) / sum_p
+        p *= self.weights * self.norm
+        return np.sum(p[:, np.atleast_1d(i)], axis=1) / np.sum(p, axis=1)
 
 
 # %%
@@ -143,7 +163,11 @@ def rij(period: np.ndarray, xi: np.ndarray, xj: np.ndarray) -> np.ndarray:
     """Get the position vectors between two points. PBC are taken into account."""
     xij = xi - xj
     if period is not None:
-        xij -= np.round(xij / period) * period
+        # wrap in place, reusing a single temporary for the periodic images
+        shift = xij / period
+        np.round(shift, out=shift)
+        shift *= period
+        xij -= shift
 
     return xij
 
@@ -159,8 +183,8 @@ fitted_model = GaussianMixtureModel(
 # To plot the probability density contour, we need to create a grid of points:
 x, y = np.meshgrid(np.linspace(-6, 12, 100), np.linspace(-8, 8))
 points = np.concatenate(np.stack([x, y], axis=-1))
-probs = np.array([original_model(point) for point in points])
-fitted_probs = np.array([fitted_model(point) for point in points])
+probs = original_model(points)
+fitted_probs = fitted_model(points)
 
 fig, ax = plt.subplots()
 ct1 = ax.contour(x, y, probs.reshape(x.shape), colors="blue")
@@ -69,6 +69,10 @@ These selectors are available:
 * :ref:`PCov-FPS-api` extends upon FPS much like PCov-CUR does to CUR.
 * :ref:`Voronoi-FPS-api`: conduct FPS selection, taking advantage of Voronoi
   tessellations to accelerate selection.
+* :ref:`Bucket-FPS-api`: conduct FPS selection of samples, skipping the buckets of a
+  k-d tree which are too far from a new selection to be updated.
+* :ref:`Cluster-FPS-api`: conduct FPS selection of samples independently within the
+  clusters of a k-means partition, possibly in parallel.
 * :ref:`DCH-api`: selects samples by constructing a directional convex hull and
   determining which samples lie on the bounding surface.
 """
@@ -997,15 +1001,15 @@ class _FPS(GreedySelector):
     def _update_hausdorff(self, X, y, last_selected):
         self.hausdorff_at_select_[last_selected] = self.hausdorff_[last_selected]
 
-        # distances of all points to the new point
+        # distances of all points to the new point, accumulated in place on the
+        # result of the matrix-vector product to avoid further temporaries
         if self._axis == 1:
-            new_dist = (
-                self.norms_ + self.norms_[last_selected] - 2 * X[:, last_selected].T @ X
-            )
+            new_dist = X[:, last_selected] @ X
         else:
-            new_dist = (
-                self.norms_ + self.norms_[last_selected] - 2 * X[last_selected] @ X.T
-            )
+            new_dist = X @ X[last_selected]
+        new_dist *= -2
+        new_dist += self.norms_
+        new_dist += self.norms_[last_selected]
 
         # update in-place the Hausdorff distance list
         np.minimum(self.hausdorff_, new_dist, self.hausdorff_)
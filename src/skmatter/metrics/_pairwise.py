@@ -4,6 +4,10 @@ import numpy as np
 from sklearn.metrics.pairwise import _euclidean_distances, check_pairwise_arrays
 
 
+# number of rows and columns of the tiles of a periodic distance matrix
+_PERIODIC_BLOCK_SIZE = 256
+
+
 def periodic_pairwise_euclidean_distances(
     X,
     Y=None,
@@ -54,7 +58,8 @@ def periodic_pairwise_euclidean_distances(
     -------
     distances : ndarray of shape (n_samples_X, n_samples_Y)
         Returns the distances between the row vectors of `X`
-        and the row vectors of `Y`.
+        and the row vectors of `Y`. The distances are single precision if both `X`
+        and `Y` are single precision, and double precision otherwise.
 
     Examples
     --------
@@ -81,12 +86,24 @@ def periodic_pairwise_euclidean_distances(
 
 
 def _periodic_euclidean_distances(X, Y=None, *, squared=False, cell=None):
-    X, Y = np.array(X).astype(float), np.array(Y).astype(float)
-    XY = np.concatenate([x - Y for x in X])
-    XY -= np.round(XY / cell) * cell
-    distance = np.linalg.norm(XY, axis=1).reshape(X.shape[0], Y.shape[0])
-    if squared:
-        distance **= 2
+    # keep the floating point precision of the inputs, so that single precision
+    # arrays are processed without being promoted to double precision
+    dtype = np.result_type(X, Y, np.float32)
+    X, Y = np.asarray(X, dtype=dtype), np.asarray(Y, dtype=dtype)
+    cell = np.asarray(cell, dtype=dtype)
+    distance = np.empty((X.shape[0], Y.shape[0]), dtype=dtype)
+    # compute the distances tile by tile, so that the pairwise differences are never
+    # stored for all the pairs at once and each tile stays in cache
+    for i in range(0, X.shape[0], _PERIODIC_BLOCK_SIZE):
+        rows = slice(i, i + _PERIODIC_BLOCK_SIZE)
+        Xi = X[rows, np.newaxis, :]
+        for j in range(0, Y.shape[0], _PERIODIC_BLOCK_SIZE):
+            cols = slice(j, j + _PERIODIC_BLOCK_SIZE)
+            XY = Xi - Y[np.newaxis, cols, :]
+            XY -= np.round(XY / cell) * cell
+            np.einsum("ijk,ijk->ij", XY, XY, out=distance[rows, cols])
+    if not squared:
+        np.sqrt(distance, out=distance)
     return distance
 
 
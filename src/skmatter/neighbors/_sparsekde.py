@@ -150,13 +150,22 @@ class SparseKDE(BaseEstimator):
     def kdecut_squared(self):
         return (3 * (np.sqrt(self.descriptors.shape[1]) + 1)) ** 2
 
+    @property
+    def _bandwidth_chol(self):
+        if self.fitted_:
+            if self._bandwidth_chol_ is None:
+                self._bandwidth_chol_ = np.linalg.cholesky(self.bandwidth_)
+        else:
+            raise ValueError("The model is not fitted yet.")
+        return self._bandwidth_chol_
+
     @property
     def _bandwidth_inv(self):
         if self.fitted_:
             if self._bandwidth_inv_ is None:
-                self._bandwidth_inv_ = np.array(
-                    [np.linalg.inv(h) for h in self.bandwidth_]
-                )
+                # the inverse of L @ L.T is L^{-T} @ L^{-1}
+                chol_inv = np.linalg.inv(self._bandwidth_chol)
+                self._bandwidth_inv_ = np.swapaxes(chol_inv, 1, 2) @ chol_inv
         else:
             raise ValueError("The model is not fitted yet.")
         return self._bandwidth_inv_
@@ -165,12 +174,12 @@ class SparseKDE(BaseEstimator):
     def _normkernels(self):
         if self.fitted_:
             if self._normkernels_ is None:
-                self._normkernels_ = np.array(
-                    [
-                        self.ndimension * np.log(2 * np.pi) + np.linalg.slogdet(h)[1]
-                        for h in self.bandwidth_
-                    ]
+                # the log-determinants are read off the diagonals of the Cholesky
+                # factors
+                logdet = 2 * np.sum(
+                    np.log(np.diagonal(self._bandwidth_chol, axis1=1, axis2=2)), axis=1
                 )
+                self._normkernels_ = self.ndimension * np.log(2 * np.pi) + logdet
         else:
             raise ValueError("The model is not fitted yet.")
         return self._normkernels_
@@ -199,7 +208,9 @@ class SparseKDE(BaseEstimator):
         self : object
             Returns the instance itself.
         """
-        # Initialize/reset the cached properties, _bandwidth_inv and _normkernels
+        # Initialize/reset the cached properties, _bandwidth_chol, _bandwidth_inv and
+        # _normkernels
+        self._bandwidth_chol_ = None
         self._bandwidth_inv_ = None
         self._normkernels_ = None
         self._check_dimension(X)
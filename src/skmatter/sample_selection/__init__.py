@@ -10,6 +10,17 @@ from ._base import (
     PCovCUR,
     PCovFPS,
 )
+from ._bucket_fps import BucketFPS
+from ._cluster_fps import ClusterFPS
 from ._voronoi_fps import VoronoiFPS
 
-__all__ = ["PCovFPS", "PCovCUR", "FPS", "CUR", "DirectionalConvexHull", "VoronoiFPS"]
+__all__ = [
+    "PCovFPS",
+    "PCovCUR",
+    "FPS",
+    "CUR",
+    "DirectionalConvexHull",
+    "VoronoiFPS",
+    "BucketFPS",
+    "ClusterFPS",
+]
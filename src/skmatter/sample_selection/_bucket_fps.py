@@ -0,0 +1,206 @@
+import numbers
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from .._selection import _FPS
+
+
+class BucketFPS(_FPS):
+    """
+    Farthest Point Sampling accelerated by grouping the samples into buckets, following
+    the idea of QuickFPS.
+
+    The samples are first partitioned into the leaves ("buckets") of a k-d tree, and
+    the axis-aligned bounding box of every bucket is stored together with the largest
+    Hausdorff distance of the samples it contains. When a new point is selected, the
+    distance between the point and the bounding box of a bucket is a lower bound to its
+    distance from any of the samples of the bucket. If this lower bound is not smaller
+    than the largest Hausdorff distance of the bucket, none of the samples can move
+    closer to the selected set, and the bucket is skipped entirely.
+
+    The selection is identical to that of :py:class:`skmatter.sample_selection.FPS`,
+    but the Hausdorff distances are only recomputed for the samples of the buckets
+    close to the newly selected point. The pruning is most effective for large numbers
+    of samples in a low-dimensional space, where the buckets are compact.
+
+    Parameters
+    ----------
+    leaf_size: int, default=None
+        Largest number of samples in a bucket. If :obj:`None`, it is set to the square
+        root of the number of samples, which balances the cost of checking all the
+        buckets against the cost of updating the samples within them.
+    initialize: int, list of int, numpy.ndarray of int, or 'random', default=0
+        Index of the first selection(s). If 'random', picks a random
+        value when fit starts. Stored in :py:attr:`self.initialize`.
+    n_to_select : int or float, default=None
+        The number of selections to make. If `None`, half of the samples are selected.
+        If integer, the parameter is the absolute number of selections to make. If float
+        between 0 and 1, it is the fraction of the total dataset to select. Stored in
+        :py:attr:`self.n_to_select`.
+    score_threshold : float, default=None
+        Threshold for the score. If `None` selection will continue until the n_to_select
+        is chosen. Otherwise will stop when the score falls below the threshold. Stored
+        in :py:attr:`self.score_threshold`.
+    score_threshold_type : str, default="absolute"
+        How to interpret the ``score_threshold``. When "absolute", the score used by the
+        selector is compared to the threshold directly. When "relative", at each
+        iteration, the score used by the selector is compared proportionally to the
+        score of the first selection, i.e. the selector quits when ``current_score /
+        first_score < threshold``. Stored in :py:attr:`self.score_threshold_type`.
+    progress_bar: bool, default=False
+        option to use `tqdm <https://tqdm.github.io/>`_ progress bar to monitor
+        selections. Stored in :py:attr:`self.report_progress`.
+    full : bool, default=False
+        In the case that all non-redundant selections are exhausted, choose randomly
+        from the remaining samples. Stored in :py:attr:`self.full`.
+    random_state : int or :class:`numpy.random.RandomState` instance, default=0
+
+    Attributes
+    ----------
+    n_selected_ : int
+        Counter tracking the number of selections that have been made
+    X_selected_ : numpy.ndarray,
+        Matrix containing the selected samples, for use in fitting
+    selected_idx_ : numpy.ndarray
+        indices of selected samples
+    bucket_order_ : numpy.ndarray of shape (n_samples,)
+        indices of the samples in the ordering given by the k-d tree, in which the
+        samples of each bucket are contiguous
+    bucket_bounds_ : numpy.ndarray of shape (n_buckets + 1,)
+        boundaries of the buckets in the ordering of the samples given by the k-d tree
+    bucket_min_ : numpy.ndarray of shape (n_buckets, n_features)
+        lower corner of the bounding box of each bucket
+    bucket_max_ : numpy.ndarray of shape (n_buckets, n_features)
+        upper corner of the bounding box of each bucket
+    bucket_hausdorff_ : numpy.ndarray of shape (n_buckets,)
+        the largest Hausdorff distance of the samples in each bucket
+
+    Examples
+    --------
+    >>> from skmatter.sample_selection import BucketFPS
+    >>> import numpy as np
+    >>> selector = BucketFPS(
+    ...     n_to_select=2,
+    ...     # largest number of samples per bucket
+    ...     leaf_size=2,
+    ...     # int or 'random', default=0
+    ...     # Index of the first selection.
+    ...     # If "random", picks a random value when fit starts.
+    ...     initialize=0,
+    ... )
+    >>> X = np.array(
+    ...     [
+    ...         [0.12, 0.21, 0.02],  # 3 samples, 3 features
+    ...         [-0.09, 0.32, -0.10],
+    ...         [-0.03, -0.53, 0.08],
+    ...     ]
+    ... )
+    >>> selector.fit(X)
+    BucketFPS(leaf_size=2, n_to_select=2)
+    >>> selector.selected_idx_
+    array([0, 2])
+    """
+
+    def __init__(
+        self,
+        leaf_size=None,
+        initialize=0,
+        n_to_select=None,
+        score_threshold=None,
+        score_threshold_type="absolute",
+        progress_bar=False,
+        full=False,
+        random_state=0,
+    ):
+        self.leaf_size = leaf_size
+        super().__init__(
+            selection_type="sample",
+            initialize=initialize,
+            n_to_select=n_to_select,
+            score_threshold=score_threshold,
+            score_threshold_type=score_threshold_type,
+            progress_bar=progress_bar,
+            full=full,
+            random_state=random_state,
+        )
+
+    def _init_greedy_search(self, X, y, n_to_select):
+        """Initializes the search. Partitions the samples into buckets, before making
+        the initial selection (unless provided) and computing the starting hausdorff
+        distances.
+        """
+        if self.leaf_size is None:
+            leaf_size = max(int(np.sqrt(X.shape[0])), 1)
+        elif isinstance(self.leaf_size, numbers.Integral) and self.leaf_size > 0:
+            leaf_size = self.leaf_size
+        else:
+            raise ValueError(
+                f"leaf_size should be a positive integer. Received {self.leaf_size}"
+            )
+
+        tree = cKDTree(X, leafsize=leaf_size)
+        leaves = []
+        nodes = [tree.tree]
+        while nodes:
+            node = nodes.pop()
+            if node.split_dim == -1:
+                leaves.append(node.start_idx)
+            else:
+                nodes.extend([node.lesser, node.greater])
+
+        # the samples of each bucket are contiguous in the ordering of the tree
+        self.bucket_order_ = tree.indices
+        self.bucket_bounds_ = np.append(np.sort(leaves), X.shape[0])
+        X_ordered = X[self.bucket_order_]
+        self.bucket_min_ = np.minimum.reduceat(X_ordered, self.bucket_bounds_[:-1])
+        self.bucket_max_ = np.maximum.reduceat(X_ordered, self.bucket_bounds_[:-1])
+        self.bucket_hausdorff_ = np.full(len(self.bucket_bounds_) - 1, np.inf)
+
+        super()._init_greedy_search(X, y, n_to_select)
+
+    def _get_active(self, X, last_selected):
+        """
+        Finds the buckets which may contain samples closer to the last selected point
+        than to any of the previous selections.
+
+        The squared distance between the point and the bounding box of a bucket is a
+        lower bound to the squared distance from any of its samples, so a bucket only
+        needs to be updated when this bound is smaller than the largest Hausdorff
+        distance of its samples.
+        """
+        point = X[last_selected]
+        box_dist = (
+            np.maximum(self.bucket_min_ - point, 0.0)
+            + np.maximum(point - self.bucket_max_, 0.0)
+        ) ** 2
+
+        return np.flatnonzero(box_dist.sum(axis=1) < self.bucket_hausdorff_)
+
+    def _update_hausdorff(self, X, y, last_selected):
+        self.hausdorff_at_select_[last_selected] = self.hausdorff_[last_selected]
+
+        active_buckets = self._get_active(X, last_selected)
+        if len(active_buckets) == 0:
+            return
+
+        starts = self.bucket_bounds_[active_buckets]
+        ends = self.bucket_bounds_[active_buckets + 1]
+        active_points = np.concatenate(
+            [self.bucket_order_[start:end] for start, end in zip(starts, ends)]
+        )
+
+        # distances of the points in the active buckets to the new point
+        new_dist = (
+            self.norms_[active_points]
+            + self.norms_[last_selected]
+            - 2 * X[active_points] @ X[last_selected]
+        )
+
+        self.hausdorff_[active_points] = np.minimum(
+            self.hausdorff_[active_points], new_dist
+        )
+        offsets = np.concatenate([[0], np.cumsum(ends - starts)[:-1]])
+        self.bucket_hausdorff_[active_buckets] = np.maximum.reduceat(
+            self.hausdorff_[active_points], offsets
+        )
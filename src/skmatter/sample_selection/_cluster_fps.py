@@ -0,0 +1,215 @@
+import numbers
+
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.cluster import MiniBatchKMeans
+
+from .._selection import GreedySelector
+from ._base import FPS
+
+
+class ClusterFPS(GreedySelector):
+    """
+    Farthest Point Sampling run independently within the clusters of a coarse k-means
+    partition of the samples.
+
+    The samples are first partitioned with :py:class:`sklearn.cluster.MiniBatchKMeans`.
+    Every cluster receives one selection, and the remaining ones are shared among the
+    clusters proportionally to their number of samples. A
+    :py:class:`skmatter.sample_selection.FPS` is then run within each cluster, starting
+    from the sample closest to its centroid. As the clusters do not depend on each
+    other, they can be processed in parallel, and each of them only requires its share
+    of the (serial) FPS iterations over its share of the samples.
+
+    The selection is not the same as that of a global FPS. Since the selections are
+    shared by population rather than by extent, sparse or isolated clusters are covered
+    more coarsely, and the largest distance of a sample from the selections is
+    generally larger than with FPS. Two clusters can also each select a sample on their
+    side of a shared boundary, so that some of the selections can be very close to each
+    other.
+
+    When refitting with ``warm_start=True``, the partition of the earlier fit is kept,
+    the new selections are shared among its clusters in the same way, and the FPS of
+    each cluster continues from its earlier selections, which are all retained.
+
+    Parameters
+    ----------
+    n_clusters: int, default=None
+        Number of clusters of the partition. If :obj:`None`, it is set to the square
+        root of the number of selections, which balances the number of clusters
+        against the number of selections within each of them.
+    n_to_select : int or float, default=None
+        The number of selections to make. If `None`, half of the samples are selected.
+        If integer, the parameter is the absolute number of selections to make. If float
+        between 0 and 1, it is the fraction of the total dataset to select. Stored in
+        :py:attr:`self.n_to_select`.
+    progress_bar: bool, default=False
+        option to use `tqdm <https://tqdm.github.io/>`_ progress bar to monitor the
+        clusters. Stored in :py:attr:`self.report_progress`.
+    n_jobs : int, default=None
+        The number of jobs to use for the FPS of the clusters. :obj:`None` means 1
+        unless in a :obj:`joblib.parallel_backend` context. ``-1`` means using all
+        processors.
+    random_state : int or :class:`numpy.random.RandomState` instance, default=0
+        Random state of the k-means partition.
+
+    Attributes
+    ----------
+    n_selected_ : int
+        Counter tracking the number of selections that have been made
+    X_selected_ : numpy.ndarray,
+        Matrix containing the selected samples, for use in fitting
+    selected_idx_ : numpy.ndarray
+        indices of selected samples, starting with the sample closest to the centroid of
+        each cluster
+    labels_ : numpy.ndarray of shape (n_samples,)
+        the cluster of each sample
+    hausdorff_ : numpy.ndarray of shape (n_samples,)
+        the squared distance from each sample to the closest selection of its cluster
+
+    Examples
+    --------
+    >>> from skmatter.sample_selection import ClusterFPS
+    >>> import numpy as np
+    >>> selector = ClusterFPS(
+    ...     n_clusters=2,
+    ...     n_to_select=4,
+    ... )
+    >>> X = np.array(
+    ...     [
+    ...         [0.12, 0.21, 0.02],  # 6 samples, 3 features
+    ...         [0.09, 0.32, -0.10],
+    ...         [0.15, 0.26, 0.08],
+    ...         [-2.03, -2.53, 2.08],
+    ...         [-2.01, -2.42, 2.11],
+    ...         [-1.93, -2.47, 2.02],
+    ...     ]
+    ... )
+    >>> selector.fit(X)
+    ClusterFPS(n_clusters=2, n_to_select=4)
+    >>> np.sort(selector.selected_idx_)
+    array([0, 1, 3, 5])
+    """
+
+    def __init__(
+        self,
+        n_clusters=None,
+        n_to_select=None,
+        progress_bar=False,
+        n_jobs=None,
+        random_state=0,
+    ):
+        self.n_clusters = n_clusters
+        self.n_jobs = n_jobs
+        super().__init__(
+            selection_type="sample",
+            n_to_select=n_to_select,
+            progress_bar=progress_bar,
+            random_state=random_state,
+        )
+
+    def score(self, X, y=None):
+        """
+        Returns the Hausdorff distances of all samples to the selections of their
+        cluster
+
+        Parameters
+        ----------
+        X : ignored
+        y : ignored
+
+        Returns
+        -------
+        hausdorff : Hausdorff distances
+        """
+        return self.hausdorff_
+
+    def _init_greedy_search(self, X, y, n_to_select):
+        """Partitions the samples and makes all the selections, running FPS within
+        each cluster.
+        """
+        if self.n_clusters is None:
+            n_clusters = max(int(np.sqrt(n_to_select)), 1)
+        elif (
+            isinstance(self.n_clusters, numbers.Integral)
+            and 0 < self.n_clusters <= n_to_select
+        ):
+            n_clusters = self.n_clusters
+        else:
+            raise ValueError(
+                "n_clusters should be a positive integer no larger than the number of "
+                f"selections. Received {self.n_clusters}"
+            )
+
+        super()._init_greedy_search(X, y, n_to_select)
+
+        kmeans = MiniBatchKMeans(n_clusters=n_clusters, random_state=self.random_state)
+        self.labels_ = kmeans.fit_predict(X)
+        self.hausdorff_ = np.full(X.shape[0], np.inf)
+
+        # every non-empty cluster gets one selection, so that no region is left
+        # uncovered, starting the FPS from the sample closest to its centroid
+        for k in range(n_clusters):
+            idx = np.flatnonzero(self.labels_ == k)
+            if len(idx) > 0:
+                distances = ((X[idx] - kmeans.cluster_centers_[k]) ** 2).sum(axis=1)
+                center = idx[np.argmin(distances)]
+                self.hausdorff_[idx] = ((X[idx] - X[center]) ** 2).sum(axis=1)
+                self._update_post_selection(X, y, center)
+
+        self._select_in_clusters(X, y, n_to_select)
+
+    def _continue_greedy_search(self, X, y, n_to_select):
+        """Continues the search. Keeps the partition and the selections of the earlier
+        fit, and continues the FPS within each cluster.
+        """
+        super()._continue_greedy_search(X, y, n_to_select)
+        self._select_in_clusters(X, y, n_to_select)
+
+    def _select_in_clusters(self, X, y, n_to_select):
+        """Shares the selections left among the clusters, proportionally to the samples
+        left in each of them, and continues the FPS of each cluster from its selections.
+        """
+        n_remaining = n_to_select - self.n_selected_
+        if n_remaining <= 0:
+            return
+
+        # the leftovers of the proportional shares go to the largest remainders
+        selected = self.selected_idx_[: self.n_selected_]
+        sizes = np.bincount(self.labels_)
+        capacity = sizes - np.bincount(self.labels_[selected], minlength=len(sizes))
+        quotas = n_remaining * capacity / capacity.sum()
+        shares = np.floor(quotas).astype(int)
+        leftover = n_remaining - shares.sum()
+        shares[np.argsort(shares - quotas, kind="stable")[:leftover]] += 1
+
+        clusters = []
+        for k in np.flatnonzero(shares):
+            idx = np.flatnonzero(self.labels_ == k)
+            initialize = np.searchsorted(idx, selected[self.labels_[selected] == k])
+            clusters.append((idx, initialize, len(initialize) + shares[k]))
+        selections = Parallel(n_jobs=self.n_jobs)(
+            delayed(_cluster_fps)(X[idx], n_selections, initialize)
+            for idx, initialize, n_selections in self.report_progress_(clusters)
+        )
+
+        for (idx, initialize, _), (new_selected, hausdorff) in zip(
+            clusters, selections
+        ):
+            self.hausdorff_[idx] = hausdorff
+            for i in idx[new_selected]:
+                self._update_post_selection(X, y, i)
+
+
+def _cluster_fps(X, n_to_select, initialize):
+    """Continues FPS within a single cluster from the selections in ``initialize``,
+    returning the new selected indices and the squared distances of the samples to all
+    the selections.
+    """
+    n_selected = len(initialize)
+    if n_to_select == len(X):
+        return np.setdiff1d(np.arange(len(X)), initialize), np.zeros(len(X))
+
+    selector = FPS(n_to_select=n_to_select, initialize=initialize)
+    selector.fit(X)
+    return selector.selected_idx_[n_selected:], selector.hausdorff_
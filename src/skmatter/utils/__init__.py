@@ -12,6 +12,7 @@ from ._pcovr_utils import (
     check_krr_fit,
     check_lr_fit,
     pcovr_covariance,
+    pcovr_covariance_parts,
     pcovr_kernel,
 )
 from ._progress_bar import (
@@ -28,6 +29,7 @@ __all__ = [
     "get_progress_bar",
     "no_progress_bar",
     "pcovr_covariance",
+    "pcovr_covariance_parts",
     "pcovr_kernel",
     "check_krr_fit",
     "check_lr_fit",
@@ -1,4 +1,4 @@
-from copy import deepcopy
+from copy import copy
 
 import numpy as np
 from sklearn.base import clone
@@ -11,7 +11,11 @@ from sklearn.utils.validation import check_is_fitted
 def check_lr_fit(regressor, X, y):
     r"""
     Checks that a (linear) regressor is fitted, and if not,
-    fits it with the provided data
+    fits it with the provided data.
+
+    A fitted regressor is returned as a shallow copy, which shares its fitted
+    arrays (e.g. ``coef_``) with the original one, so these should not be
+    modified in place.
 
     :param regressor: sklearn-style regressor
     :type regressor: object
@@ -24,7 +28,7 @@ def check_lr_fit(regressor, X, y):
     """
     try:
         check_is_fitted(regressor)
-        fitted_regressor = deepcopy(regressor)
+        fitted_regressor = copy(regressor)
 
         # Check compatibility with X
         fitted_regressor._validate_data(X, y, reset=False, multi_output=True)
@@ -56,7 +60,11 @@ def check_lr_fit(regressor, X, y):
 def check_krr_fit(regressor, K, X, y):
     r"""
     Checks that a (kernel ridge) regressor is fitted, and if not,
-    fits it with the provided data
+    fits it with the provided data.
+
+    A fitted regressor is returned as a shallow copy, which shares its fitted
+    arrays (e.g. ``dual_coef_``) with the original one, so these should not be
+    modified in place.
 
     :param regressor: sklearn-style regressor
     :type regressor: object
@@ -71,7 +79,7 @@ def check_krr_fit(regressor, K, X, y):
     """
     try:
         check_is_fitted(regressor)
-        fitted_regressor = deepcopy(regressor)
+        fitted_regressor = copy(regressor)
 
         # Check compatibility with K
         fitted_regressor._validate_data(X, y, reset=False, multi_output=True)
@@ -113,6 +121,7 @@ def pcovr_covariance(
     rank=None,
     random_state=0,
     iterated_power="auto",
+    parts=None,
 ):
     r"""Creates the PCovR modified covariance.
 
@@ -143,48 +152,139 @@ def pcovr_covariance(
         number of eigenpairs to estimate the inverse square root with
     random_state : int, default=0
         random seed to use for randomized svd
+    parts : tuple, default=None
+        the parts of the covariance which do not depend on the mixing parameter, as
+        returned by :py:func:`pcovr_covariance_parts` for the same `X` and `Y`. When
+        given, `rcond`, `rank`, `random_state` and `iterated_power` are ignored, and
+        the covariance is composed from the parts, e.g. to scan several values of
+        `mixing`.
     """
-    C = np.zeros((X.shape[1], X.shape[1]), dtype=np.float64)
+    if parts is None:
+        if mixing == 1 and not return_isqrt:
+            # no decomposition is needed
+            return np.asarray(X.T @ X, dtype=np.float64)
+
+        parts = pcovr_covariance_parts(
+            X,
+            Y,
+            rcond=rcond,
+            rank=rank,
+            random_state=random_state,
+            iterated_power=iterated_power,
+            with_xtx=mixing > 0,
+            with_yy=mixing < 1,
+        )
+    XTX, UC, vC, C_YY = parts
+
+    # the covariance is allocated by the first term rather than zero-initialized
+    if mixing > 0:
+        C = np.asarray(mixing * XTX, dtype=np.float64)
+        if mixing < 1:
+            C += (1 - mixing) * C_YY
+    else:
+        C = np.array(C_YY, dtype=np.float64)
 
-    if mixing < 1 or return_isqrt:
-        if rank is None:
-            rank = min(X.shape)
+    if return_isqrt:
+        # C_isqrt = UC @ diag(1 / vC) @ UC.T, without building the diagonal matrix
+        return C, (UC / vC) @ UC.T
+    else:
+        return C
 
-        if rank >= min(X.shape):
-            vC, UC = np.linalg.eigh(X.T @ X)
 
-            vC = np.flip(vC)
-            UC = np.flip(UC, axis=1)[:, vC > rcond]
-            vC = np.sqrt(vC[vC > rcond])
+def pcovr_covariance_parts(
+    X,
+    Y,
+    rcond=1e-12,
+    rank=None,
+    random_state=0,
+    iterated_power="auto",
+    with_xtx=True,
+    with_yy=True,
+):
+    r"""Computes the parts of the PCovR modified covariance which do not depend on the
+    mixing parameter, so that :py:func:`pcovr_covariance` can be evaluated for
+    several mixing parameters at the cost of a single decomposition.
 
-        else:
-            _, vC, UC = randomized_svd(
-                X,
-                n_components=rank,
-                n_iter=iterated_power,
-                flip_sign=True,
-                random_state=random_state,
-            )
+    Parameters
+    ----------
+    X : numpy.ndarray of shape (n x m)
+        Data matrix :math:`\mathbf{X}`
+    Y : numpy.ndarray of shape (n x p)
+        Array to include in biased selection when mixing < 1
+    rcond : float,  default=1E-12
+        threshold below which eigenvalues will be considered 0,
+    rank : int, default=min(X.shape)
+        number of eigenpairs to estimate the inverse square root with
+    random_state : int, default=0
+        random seed to use for randomized svd
+    with_xtx : bool, default=True
+        whether to compute :math:`\mathbf{X}^T \mathbf{X}`, only needed when mixing > 0
+    with_yy : bool, default=True
+        whether to compute the target term of the covariance, only needed when
+        mixing < 1
+
+    Returns
+    -------
+    XTX : numpy.ndarray of shape (m x m) or None
+        :math:`\mathbf{X}^T \mathbf{X}`
+    UC : numpy.ndarray of shape (m x rank)
+        eigenvectors of :math:`\mathbf{X}^T \mathbf{X}`
+    vC : numpy.ndarray of shape (rank,)
+        square roots of the eigenvalues of :math:`\mathbf{X}^T \mathbf{X}`
+    C_YY : numpy.ndarray of shape (m x m) or None
+        :math:`\left(\mathbf{X}^T \mathbf{X}\right)^{-\frac{1}{2}} \mathbf{X}^T
+        \mathbf{\hat{Y}}\mathbf{\hat{Y}}^T \mathbf{X} \left(\mathbf{X}^T
+        \mathbf{X}\right)^{-\frac{1}{2}}`
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from skmatter.utils import pcovr_covariance, pcovr_covariance_parts
+    >>> X = np.array([[1.0, 2.0], [3.0, 1.0], [0.0, 1.0]])
+    >>> Y = np.array([[1.0], [2.0], [0.5]])
+    >>> parts = pcovr_covariance_parts(X, Y)
+    >>> covariances = [
+    ...     pcovr_covariance(mixing, X, Y, parts=parts) for mixing in [0.0, 0.5, 1.0]
+    ... ]
+    >>> np.allclose(covariances[1], pcovr_covariance(0.5, X, Y))
+    True
+    """
+    XTX = X.T @ X if with_xtx else None
 
-            UC = UC.T[:, (vC**2) > rcond]
-            vC = vC[(vC**2) > rcond]
+    if rank is None:
+        rank = min(X.shape)
 
-        C_isqrt = UC @ np.diagflat(1.0 / vC) @ UC.T
+    if rank >= min(X.shape):
+        if XTX is None:
+            vC, UC = np.linalg.eigh(X.T @ X)
+        else:
+            vC, UC = np.linalg.eigh(XTX)
+
+        vC = np.flip(vC)
+        UC = np.flip(UC, axis=1)[:, vC > rcond]
+        vC = np.sqrt(vC[vC > rcond])
 
+    else:
+        _, vC, UC = randomized_svd(
+            X,
+            n_components=rank,
+            n_iter=iterated_power,
+            flip_sign=True,
+            random_state=random_state,
+        )
+
+        UC = UC.T[:, (vC**2) > rcond]
+        vC = vC[(vC**2) > rcond]
+
+    C_YY = None
+    if with_yy:
         # parentheses speed up calculation greatly
-        C_Y = C_isqrt @ (X.T @ Y)
-        C_Y = C_Y.reshape((C.shape[0], -1))
+        C_Y = (UC / vC) @ (UC.T @ (X.T @ Y))
+        C_Y = C_Y.reshape((X.shape[1], -1))
         C_Y = np.real(C_Y)
+        C_YY = np.asarray(C_Y @ C_Y.T, dtype=np.float64)
 
-        C += (1 - mixing) * np.array(C_Y @ C_Y.T, dtype=np.float64)
-
-    if mixing > 0:
-        C += (mixing) * (X.T @ X)
-
-    if return_isqrt:
-        return C, C_isqrt
-    else:
-        return C
+    return XTX, UC, vC, C_YY
 
 
 def pcovr_kernel(mixing, X, Y, **kernel_params):
@@ -212,15 +312,21 @@ def pcovr_kernel(mixing, X, Y, **kernel_params):
                     dictionary of arguments to pass to pairwise_kernels
                     if none are specified, assumes that the kernel is linear
     """
-    K = np.zeros((X.shape[0], X.shape[0]))
-    if mixing < 1:
-        K += (1 - mixing) * Y @ Y.T
+    # the kernel is allocated by the first term rather than zero-initialized, and the
+    # parentheses keep the products of the form A @ A.T, for which numpy calls the
+    # symmetric rank-k update (syrk) instead of a general matrix product
     if mixing > 0:
         if "kernel" not in kernel_params:
-            K += (mixing) * X @ X.T
+            K = np.asarray(X @ X.T, dtype=np.float64)
         elif kernel_params.get("kernel") != "precomputed":
-            K += (mixing) * pairwise_kernels(X, **kernel_params)
+            K = np.asarray(pairwise_kernels(X, **kernel_params), dtype=np.float64)
         else:
-            K += (mixing) * X
+            # copy, so that the precomputed kernel is not modified in place
+            K = np.array(X, dtype=np.float64)
+        if mixing < 1:
+            K *= mixing
+            K += (1 - mixing) * (Y @ Y.T)
+    else:
+        K = np.asarray(Y @ Y.T, dtype=np.float64)
 
     return K
@@ -0,0 +1,114 @@
+import unittest
+
+import numpy as np
+from test_sample_simple_fps import TestFPS
+
+from skmatter.sample_selection import FPS, BucketFPS
+
+
+class TestBucketFPS(TestFPS):
+    def setUp(self):
+        super().setUp()
+
+    def test_restart(self):
+        """Checks that the model can be restarted with a new number of
+        samples and `warm_start`
+        """
+        selector = BucketFPS(n_to_select=1, initialize=self.idx[0])
+        selector.fit(self.X)
+
+        for i in range(2, len(self.idx)):
+            selector.n_to_select = i
+            selector.fit(self.X, warm_start=True)
+            self.assertEqual(selector.selected_idx_[i - 1], self.idx[i - 1])
+
+    def test_initialize(self):
+        """Checks that the model can be initialized in all applicable manners
+        and throws an error otherwise
+        """
+        for initialize in [self.idx[0], "random", self.idx[:4]]:
+            with self.subTest(initialize=initialize):
+                selector = BucketFPS(n_to_select=len(self.idx), initialize=initialize)
+                selector.fit(self.X)
+
+        with self.assertRaises(ValueError) as cm:
+            selector = BucketFPS(n_to_select=1, initialize="bad")
+            selector.fit(self.X)
+        self.assertEqual(str(cm.exception), "Invalid value of the initialize parameter")
+
+    def test_leaf_size(self):
+        """Checks that the buckets cover all the samples and that invalid leaf sizes
+        throw an error
+        """
+        for leaf_size in [None, 1, 10, self.X.shape[0]]:
+            with self.subTest(leaf_size=leaf_size):
+                selector = BucketFPS(n_to_select=1, leaf_size=leaf_size)
+                selector.fit(self.X)
+                self.assertEqual(selector.bucket_bounds_[0], 0)
+                self.assertEqual(selector.bucket_bounds_[-1], self.X.shape[0])
+                self.assertTrue(
+                    np.array_equal(
+                        np.sort(selector.bucket_order_), np.arange(self.X.shape[0])
+                    )
+                )
+
+        for leaf_size in [0, 0.5]:
+            with self.subTest(leaf_size=leaf_size):
+                with self.assertRaises(ValueError) as cm:
+                    selector = BucketFPS(n_to_select=1, leaf_size=leaf_size)
+                    selector.fit(self.X)
+                self.assertEqual(
+                    str(cm.exception),
+                    f"leaf_size should be a positive integer. Received {leaf_size}",
+                )
+
+    def test_comparison(self):
+        """Checks that the bucket FPS selects the same samples and computes the same
+        hausdorff distances as its normal FPS counterpart.
+        """
+        selector = FPS(n_to_select=self.X.shape[0] - 1)
+        selector.fit(self.X)
+
+        for leaf_size in [None, 1, 16]:
+            with self.subTest(leaf_size=leaf_size):
+                bselector = BucketFPS(
+                    n_to_select=self.X.shape[0] - 1, leaf_size=leaf_size
+                )
+                bselector.fit(self.X)
+
+                self.assertTrue(
+                    np.allclose(bselector.selected_idx_, selector.selected_idx_)
+                )
+                self.assertTrue(
+                    np.allclose(
+                        bselector.get_select_distance(), selector.get_select_distance()
+                    )
+                )
+
+    def test_pruning(self):
+        """Checks that the buckets far from a new selection are not updated"""
+        X = np.array([[0.0, 0.0], [0.1, 0.0], [10.0, 10.0], [10.1, 10.0]])
+        selector = BucketFPS(n_to_select=2, leaf_size=2, initialize=0)
+        selector.fit(X)
+
+        # only the bucket holding the first two samples is close enough to change
+        active = selector._get_active(X, 1)
+        self.assertEqual(len(active), 1)
+        start, end = selector.bucket_bounds_[active[0] : active[0] + 2]
+        self.assertEqual(sorted(selector.bucket_order_[start:end]), [0, 1])
+
+    def test_score(self):
+        """Check that function score return hausdorff distance"""
+        selector = BucketFPS(n_to_select=3, initialize=0)
+        selector.fit(self.X)
+
+        self.assertTrue(
+            np.allclose(
+                selector.hausdorff_,
+                selector.score(self.X, selector.selected_idx_[-1]),
+            )
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,121 @@
+import unittest
+
+import numpy as np
+from sklearn.datasets import load_diabetes as get_dataset
+
+from skmatter.sample_selection import ClusterFPS
+
+
+class TestClusterFPS(unittest.TestCase):
+    def setUp(self):
+        self.X, _ = get_dataset(return_X_y=True)
+
+    def test_n_clusters(self):
+        """Checks that the selections are shared among the clusters and that invalid
+        numbers of clusters throw an error
+        """
+        for n_clusters in [None, 1, 4, 40]:
+            with self.subTest(n_clusters=n_clusters):
+                selector = ClusterFPS(n_to_select=40, n_clusters=n_clusters)
+                selector.fit(self.X)
+                self.assertEqual(selector.n_selected_, 40)
+                self.assertEqual(len(np.unique(selector.selected_idx_)), 40)
+                self.assertTrue(selector.get_support().sum() == 40)
+
+        for n_clusters in [0, 0.5, 41]:
+            with self.subTest(n_clusters=n_clusters):
+                with self.assertRaises(ValueError) as cm:
+                    selector = ClusterFPS(n_to_select=40, n_clusters=n_clusters)
+                    selector.fit(self.X)
+                self.assertEqual(
+                    str(cm.exception),
+                    "n_clusters should be a positive integer no larger than the "
+                    f"number of selections. Received {n_clusters}",
+                )
+
+    def test_proportional(self):
+        """Checks that each cluster gets one selection, and a number of the remaining
+        ones proportional to its size
+        """
+        selector = ClusterFPS(n_to_select=40, n_clusters=5)
+        selector.fit(self.X)
+
+        sizes = np.bincount(selector.labels_)
+        counts = np.bincount(selector.labels_[selector.selected_idx_], minlength=5)
+        expected = 1 + 35 * (sizes - 1) / (len(self.X) - 5)
+        self.assertTrue(np.all(np.abs(counts - expected) < 1))
+
+    def test_isolated_cluster(self):
+        """Checks that a small isolated cluster still gets a selection, so that all
+        the samples are covered
+        """
+        rng = np.random.default_rng(0)
+        X = np.concatenate(
+            [rng.normal(0, 1, size=(1000, 2)), rng.normal(50, 1, size=(20, 2))]
+        )
+        selector = ClusterFPS(n_to_select=10, n_clusters=2)
+        selector.fit(X)
+
+        self.assertEqual(selector.n_selected_, 10)
+        self.assertTrue(np.any(selector.selected_idx_ >= 1000))
+        self.assertTrue(np.all(np.isfinite(selector.hausdorff_)))
+        self.assertTrue(selector.hausdorff_.max() < 50)
+
+    def test_hausdorff(self):
+        """Checks that the hausdorff distances are those to the selections of the same
+        cluster, and vanish for the selected samples
+        """
+        selector = ClusterFPS(n_to_select=20, n_clusters=3)
+        selector.fit(self.X)
+
+        for k in range(3):
+            idx = np.flatnonzero(selector.labels_ == k)
+            selected = np.intersect1d(idx, selector.selected_idx_)
+            distances = (
+                (self.X[idx, np.newaxis] - self.X[np.newaxis, selected]) ** 2
+            ).sum(axis=-1)
+            self.assertTrue(
+                np.allclose(selector.score(self.X)[idx], distances.min(axis=1))
+            )
+        self.assertTrue(np.allclose(selector.hausdorff_[selector.selected_idx_], 0))
+
+    def test_parallel(self):
+        """Checks that the selection does not depend on the number of jobs"""
+        selector = ClusterFPS(n_to_select=20, n_clusters=4)
+        selector.fit(self.X)
+        parallel_selector = ClusterFPS(n_to_select=20, n_clusters=4, n_jobs=2)
+        parallel_selector.fit(self.X)
+
+        self.assertTrue(
+            np.array_equal(selector.selected_idx_, parallel_selector.selected_idx_)
+        )
+        self.assertTrue(
+            np.allclose(selector.X_selected_, self.X[selector.selected_idx_])
+        )
+
+    def test_restart(self):
+        """Checks that the model can be refitted with a new number of samples and
+        `warm_start`, keeping the partition and the earlier selections
+        """
+        for n_clusters in [None, 2]:
+            with self.subTest(n_clusters=n_clusters):
+                selector = ClusterFPS(n_to_select=10, n_clusters=n_clusters)
+                selector.fit(self.X)
+                selected_idx = selector.selected_idx_.copy()
+                labels = selector.labels_.copy()
+
+                selector.n_to_select = 20
+                selector.fit(self.X, warm_start=True)
+                self.assertEqual(selector.n_selected_, 20)
+                self.assertEqual(len(np.unique(selector.selected_idx_)), 20)
+                self.assertTrue(np.array_equal(selector.labels_, labels))
+                self.assertTrue(
+                    np.array_equal(selector.selected_idx_[:10], selected_idx)
+                )
+                self.assertTrue(
+                    np.allclose(selector.hausdorff_[selector.selected_idx_], 0)
+                )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
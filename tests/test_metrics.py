@@ -267,6 +267,35 @@ class DistanceTests(unittest.TestCase):
             f"Calculated: {distances} Expected: {self.periodic_distances}",
         )
 
+    def test_periodic_euclidean_distance_tiles(self):
+        """Checks the distances of arrays spanning several tiles"""
+        rng = np.random.default_rng(0)
+        X = rng.uniform(-10, 10, size=(600, 2))
+        Y = rng.uniform(-10, 10, size=(300, 2))
+        XY = X[:, np.newaxis, :] - Y[np.newaxis, :, :]
+        XY -= np.round(XY / self.cell) * self.cell
+        expected = np.linalg.norm(XY, axis=-1)
+
+        distances = periodic_pairwise_euclidean_distances(X, Y, cell_length=self.cell)
+        self.assertTrue(np.allclose(distances, expected))
+
+        distances = periodic_pairwise_euclidean_distances(
+            X, Y, squared=True, cell_length=self.cell
+        )
+        self.assertTrue(np.allclose(distances, expected**2))
+
+    def test_periodic_euclidean_distance_dtype(self):
+        """Checks that single precision inputs give single precision distances"""
+        X, Y = self.X.astype(np.float32), self.Y.astype(np.float32)
+        distances = periodic_pairwise_euclidean_distances(X, Y, cell_length=self.cell)
+        self.assertEqual(distances.dtype, np.float32)
+        self.assertTrue(np.allclose(distances, self.periodic_distances))
+
+        distances = periodic_pairwise_euclidean_distances(
+            X, self.Y.astype(np.float64), cell_length=self.cell
+        )
+        self.assertEqual(distances.dtype, np.float64)
+
     def test_mahalanobis_distance(self):
         distances = pairwise_mahalanobis_distances(self.X, self.Y, self.covs)
         self.assertTrue(
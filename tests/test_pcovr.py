@@ -462,6 +462,11 @@ class PCovRInfrastructureTest(PCovRBaseTest):
         self.assertTrue(hasattr(pcovr.regressor_, "coef_"))
         self.assertTrue(regressor.get_params() != pcovr.regressor_.get_params())
 
+        # Refitting the original regressor doesn't change the PCovR regressor
+        W_pcovr = pcovr.regressor_.coef_.copy()
+        regressor.fit(self.X, -self.Y)
+        self.assertTrue(np.allclose(W_pcovr, pcovr.regressor_.coef_))
+
     def test_incompatible_regressor(self):
         regressor = KernelRidge(alpha=1e-8, kernel="linear")
         regressor.fit(self.X, self.Y)
@@ -4,7 +4,7 @@ import numpy as np
 import scipy
 from sklearn.datasets import load_diabetes as get_dataset
 
-from skmatter.utils import pcovr_covariance, pcovr_kernel
+from skmatter.utils import pcovr_covariance, pcovr_covariance_parts, pcovr_kernel
 
 
 class CovarianceTest(unittest.TestCase):
@@ -29,6 +29,23 @@ class CovarianceTest(unittest.TestCase):
                 C = pcovr_covariance(alpha, X=self.X, Y=self.Y, rcond=1e-6)
                 self.assertTrue(np.allclose(C, alpha * C_X + (1 - alpha) * C_Y))
 
+    def test_parts(self):
+        """Checks that a sweep over the mixing parameter reusing the precomputed parts
+        matches the covariances computed from scratch
+        """
+        for rank in [None, self.X.shape[1] - 2]:
+            parts = pcovr_covariance_parts(self.X, self.Y, rcond=1e-6, rank=rank)
+            for alpha in [0.0, 0.25, 0.5, 1.0]:
+                with self.subTest(rank=rank, alpha=alpha):
+                    C, C_isqrt = pcovr_covariance(
+                        alpha, self.X, self.Y, return_isqrt=True, parts=parts
+                    )
+                    C_ref, C_isqrt_ref = pcovr_covariance(
+                        alpha, self.X, self.Y, rcond=1e-6, return_isqrt=True, rank=rank
+                    )
+                    self.assertTrue(np.allclose(C, C_ref))
+                    self.assertTrue(np.allclose(C_isqrt, C_isqrt_ref))
+
     def test_no_return_isqrt(self):
         with self.assertRaises(ValueError):
             _, _ = pcovr_covariance(0.5, self.X, self.Y, return_isqrt=False)